@@ -0,0 +1,76 @@
+"""Benchmark for GET /manager/{id}/employee-status-details/{date}.
+
+Seeds a throwaway SQLite database with one manager owning EMPLOYEES reports and
+REQUESTS leave requests spread over November 2024, then calls the endpoint in-process.
+
+    python benchmarks/bench_employee_status_details.py [employees] [requests]
+"""
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+DB_PATH = os.path.join(tempfile.mkdtemp(), "bench_status_details.db")
+os.environ["TEST_DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from database import Base
+from main import app
+import models.Employee, models.Manager, models.ManagerEmployeeRelation, models.Request  # noqa: F401  register tables
+
+EMPLOYEES = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+REQUESTS = int(sys.argv[2]) if len(sys.argv) > 2 else 50_000
+ITERATIONS = 20
+
+
+def seed():
+    Base.metadata.create_all(create_engine(os.environ["TEST_DATABASE_URL"]))
+    rng = random.Random(42)
+    conn = sqlite3.connect(DB_PATH)
+    conn.executemany(
+        "INSERT INTO employee (id, name, age, contact_details, holidays_left) VALUES (?, ?, ?, ?, ?)",
+        [(i, f"Employee {i}", 30, f"employee{i}@example.com", 30) for i in range(1, EMPLOYEES + 2)],
+    )
+    conn.execute("INSERT INTO manager (id, employee_id) VALUES (1, 1)")
+    conn.executemany(
+        "INSERT INTO manager_employee_relation (manager_id, employee_id) VALUES (1, ?)",
+        [(i,) for i in range(2, EMPLOYEES + 2)],
+    )
+    rows = []
+    for _ in range(REQUESTS):
+        start = datetime(2024, 11, 1) + timedelta(days=rng.randrange(28))
+        end = start + timedelta(days=rng.randrange(3))
+        rows.append((rng.randrange(2, EMPLOYEES + 2), rng.choice(("PENDING", "APPROVED", "DENIED")), 1,
+                     datetime(2024, 10, 1), start, end))
+    conn.executemany(
+        "INSERT INTO request (author_id, status, manager_id, request_created_date, vacation_start_date, vacation_end_date) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+    conn.commit()
+    conn.close()
+
+
+def main():
+    seed()
+    client = TestClient(app)
+    timings = []
+    for i in range(ITERATIONS):
+        url = f"/manager/1/employee-status-details/2024-11-{(i % 28) + 1:02d}T00:00:00"
+        started = time.perf_counter()
+        response = client.get(url)
+        timings.append((time.perf_counter() - started) * 1000)
+        assert response.status_code == 200, response.text
+    timings.sort()
+    print(f"employees={EMPLOYEES} requests={REQUESTS} iterations={ITERATIONS}")
+    print(f"p50={statistics.median(timings):.1f}ms p95={timings[int(len(timings) * 0.95) - 1]:.1f}ms max={timings[-1]:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timedelta
+from typing import Iterable, List, Tuple, Union
+from config import PUBLIC_HOLIDAYS, BUSINESS_CALENDAR_START, BUSINESS_CALENDAR_END
+
+DateLike = Union[date, datetime]
+
+def weekdays_in_span(first_day: date, days: int) -> int:
+    """Closed-form count of Monday-Friday days among `days` consecutive days starting at `first_day`."""
+    if days <= 0:
+        return 0
+    full_weeks, remainder = divmod(days, 7)
+    weekday = first_day.weekday()
+    end = weekday + remainder
+    # The partial week covers weekdays [weekday, end), which can wrap past Sunday into the next week
+    partial = max(0, min(end, 5) - weekday) + max(0, min(end, 12) - max(weekday, 7))
+    return full_weeks * 5 + partial
+
+def _span(start_date: DateLike, end_date: DateLike) -> Tuple[date, int]:
+    # Same days the old day-by-day loop visited: start_date + k days for as long as it is <= end_date
+    days = (end_date - start_date).days + 1
+    first_day = start_date.date() if isinstance(start_date, datetime) else start_date
+    return first_day, days
+
+class BusinessCalendar:
+    """Counts business days (weekdays that are not public holidays).
+
+    A prefix-sum table over [table_start, table_end] answers any range inside it with
+    two lookups. Ranges reaching outside the table use the closed-form weekday count
+    minus a bisect over the sorted holidays.
+    """
+
+    def __init__(self, holidays: Iterable[date] = (), table_start: date = date(2020, 1, 1), table_end: date = date(2035, 12, 31)):
+        self.holidays = sorted({holiday for holiday in holidays if holiday.weekday() < 5})
+        self.table_start = table_start
+
+        holiday_set = set(self.holidays)
+        # prefix[i] = business days in [table_start, table_start + i days)
+        prefix = [0]
+        day = self.table_start
+        while day <= table_end:
+            prefix.append(prefix[-1] + (day.weekday() < 5 and day not in holiday_set))
+            day += timedelta(days=1)
+        self._prefix = prefix
+
+    @classmethod
+    def from_config(cls) -> "BusinessCalendar":
+        return cls(
+            holidays=[date.fromisoformat(holiday) for holiday in PUBLIC_HOLIDAYS],
+            table_start=date.fromisoformat(BUSINESS_CALENDAR_START),
+            table_end=date.fromisoformat(BUSINESS_CALENDAR_END),
+        )
+
+    def count_span(self, first_day: date, days: int) -> int:
+        if days <= 0:
+            return 0
+        low = (first_day - self.table_start).days
+        high = low + days
+        if low >= 0 and high < len(self._prefix):
+            return self._prefix[high] - self._prefix[low]
+        last_day = first_day + timedelta(days=days - 1)
+        holidays = bisect_right(self.holidays, last_day) - bisect_left(self.holidays, first_day)
+        return weekdays_in_span(first_day, days) - holidays
+
+    def count(self, start_date: DateLike, end_date: DateLike) -> int:
+        return self.count_span(*_span(start_date, end_date))
+
+    def count_batch(self, ranges: Iterable[Tuple[DateLike, DateLike]]) -> List[int]:
+        """Business days for many (start_date, end_date) pairs, e.g. refunds or yearly reports."""
+        prefix = self._prefix
+        table_start = self.table_start
+        table_size = len(prefix)
+        counts = []
+        for start_date, end_date in ranges:
+            first_day, days = _span(start_date, end_date)
+            low = (first_day - table_start).days
+            high = low + days
+            if days > 0 and low >= 0 and high < table_size:
+                counts.append(prefix[high] - prefix[low])
+            else:
+                counts.append(self.count_span(first_day, days))
+        return counts
+
+business_calendar = BusinessCalendar.from_config()
+
+def count_business_days(start_date: DateLike, end_date: DateLike) -> int:
+    return business_calendar.count(start_date, end_date)
+
+def count_business_days_batch(ranges: Iterable[Tuple[DateLike, DateLike]]) -> List[int]:
+    return business_calendar.count_batch(ranges)
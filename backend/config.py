@@ -1,4 +1,12 @@
 # config.py
-DATABASE_URL = "mysql+pymysql://root:@localhost:3306/holidaydb"
-TEST_DATABASE_URL = "sqlite:///./test.db"
-TESTING = True
\ No newline at end of file
+import os
+
+DATABASE_URL = os.getenv("DATABASE_URL", "mysql+pymysql://root:@localhost:3306/holidaydb")
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL", "sqlite:///./test.db")
+TESTING = True
+
+# Public holidays (YYYY-MM-DD) that do not count against holidays_left
+PUBLIC_HOLIDAYS = []
+# Span covered by the precomputed business-day table, dates outside it fall back to the closed form
+BUSINESS_CALENDAR_START = "2020-01-01"
+BUSINESS_CALENDAR_END = "2035-12-31"
@@ -1,3 +1,4 @@
+from collections import defaultdict
 from typing import List
 from fastapi import APIRouter, HTTPException
 from models.Manager import Manager as ManagerModel
@@ -5,6 +6,7 @@ from models.ManagerEmployeeRelation import ManagerEmployeeRelation as ManagerEmp
 from models.Employee import Employee as EmployeeModel
 from models.Request import Request as RequestModel
 from database import database
+from sqlalchemy import select
 from pydantic import BaseModel
 from datetime import datetime
 
@@ -86,23 +88,28 @@ async def get_employees_by_manager(manager_id: int):
     if not manager:
         raise HTTPException(status_code=404, detail="Manager not found")
 
-    relation_query = ManagerEmployeeRelationModel.__table__.select().where(ManagerEmployeeRelationModel.manager_id == manager_id)
-    employee_relations = await database.fetch_all(relation_query)
-    employee_ids = [relation.employee_id for relation in employee_relations]
+    # Fetching employees working for manager with given id in one join
+    relation_table = ManagerEmployeeRelationModel.__table__
+    employee_query = select(EmployeeModel.__table__).select_from(
+        relation_table.join(EmployeeModel.__table__, relation_table.c.employee_id == EmployeeModel.id)
+    ).where(relation_table.c.manager_id == manager_id).order_by(relation_table.c.id)
+    employees = await database.fetch_all(employee_query)
 
-    if not employee_ids:
+    if not employees:
         return []
-    # Fetching employees working for manager with given id and their requests 
-    employees = []
-    for employee_id in employee_ids:
-        employee_query = EmployeeModel.__table__.select().where(EmployeeModel.id == employee_id)
-        employee = await database.fetch_one(employee_query)
-
-        if employee:
-            request_query = RequestModel.__table__.select().where(RequestModel.author_id == employee_id)
-            requests = await database.fetch_all(request_query)
-            employee_dict = dict(employee)
-            employee_dict['requests'] = requests
-            employees.append(employee_dict)
-    
-    return employees
+
+    # Fetching all of their requests at once and grouping them by author
+    request_query = RequestModel.__table__.select().select_from(
+        RequestModel.__table__.join(relation_table, relation_table.c.employee_id == RequestModel.author_id)
+    ).where(relation_table.c.manager_id == manager_id).order_by(RequestModel.id)
+    requests_by_author = defaultdict(list)
+    for request in await database.fetch_all(request_query):
+        requests_by_author[request.author_id].append(request)
+
+    employees_with_requests = []
+    for employee in employees:
+        employee_dict = dict(employee)
+        employee_dict['requests'] = requests_by_author.get(employee.id, [])
+        employees_with_requests.append(employee_dict)
+
+    return employees_with_requests
@@ -1,14 +1,27 @@
-from fastapi import APIRouter, HTTPException
+from collections import defaultdict
+from fastapi import APIRouter, HTTPException, Request as HTTPRequest
 from typing import List, Dict
 from models.Request import Request as RequestModel
 from models.Employee import Employee as EmployeeModel
 from models.ManagerEmployeeRelation import ManagerEmployeeRelation as ManagerEmployeeRelationModel
-from database import database
-from pydantic import BaseModel, validator, constr
-from datetime import datetime, timedelta
+from database import database, execute_rowcount, insert_many
+from business_days import count_business_days, count_business_days_batch
+from sqlalchemy import case, exists, func, select
+from pydantic import BaseModel, ValidationError, validator, constr
+from datetime import date, datetime, time, timedelta
 
 router = APIRouter()
 
+MAX_STATUS_RANGE_DAYS = 366
+# Rows validated and written together by POST /requests/bulk
+BULK_CHUNK_SIZE = 500
+BULK_CHUNK_ATTEMPTS = 3
+# Per-row errors kept in the bulk import response, the rest are only counted
+MAX_REPORTED_ERRORS = 1000
+
+class BalanceChanged(Exception):
+    """A holidays_left balance changed between validating and writing a bulk import chunk."""
+
 class RequestCreate(BaseModel):
     author_id: int
     status: constr(min_length=1, max_length=50, pattern='^(PENDING|APPROVED|DENIED)$') = 'PENDING' # type: ignore
@@ -44,6 +57,19 @@ class RequestUpdate(BaseModel):
     vacation_start_date: datetime = None
     vacation_end_date: datetime = None
 
+class BulkImportResult(BaseModel):
+    received: int
+    inserted: int
+    failed: int
+    errors: List[Dict]
+    errors_truncated: bool
+
+class DailyStatusCounts(BaseModel):
+    date: date
+    working: int
+    on_leave: int
+    pending_leave: int
+
 class EmployeeStatusDetails(BaseModel):
     working: List[Dict]
     on_leave: List[Dict]
@@ -52,14 +78,118 @@ class EmployeeStatusDetails(BaseModel):
     on_leave_count: int
     pending_count: int
 
-def count_weekdays(start_date: datetime, end_date: datetime) -> int:
-    count = 0
-    current_date = start_date
-    while current_date <= end_date:
-        if current_date.weekday() < 5:  # Monday to Friday are 0-4
-            count += 1
-        current_date += timedelta(days=1)
-    return count
+def classify_employee_statuses(employees, requests, date) -> Dict:
+    """Splits employees into working / on_leave / pending for `date` in O(E + R).
+
+    Requests are bucketed by author first, so each employee only looks at their own
+    requests. APPROVED leave takes precedence over PENDING.
+    """
+    requests_by_author = defaultdict(list)
+    for request in requests:
+        # Ensure request dates are offset-naive
+        request_dict = dict(request)
+        request_dict['vacation_start_date'] = request_dict['vacation_start_date'].replace(tzinfo=None).date()
+        request_dict['vacation_end_date'] = request_dict['vacation_end_date'].replace(tzinfo=None).date()
+        requests_by_author[request_dict['author_id']].append(request_dict)
+
+    working_employees = []
+    on_leave_employees = []
+    pending_employees = []
+
+    for employee in employees:
+        employee_dict = dict(employee)
+        employee_dict['requests'] = requests_by_author.get(employee_dict['id'], [])
+
+        statuses = {
+            request['status'] for request in employee_dict['requests']
+            if request['vacation_start_date'] <= date <= request['vacation_end_date']
+        }
+        if 'APPROVED' in statuses:
+            on_leave_employees.append(employee_dict)
+        elif 'PENDING' in statuses:
+            pending_employees.append(employee_dict)
+        else:
+            working_employees.append(employee_dict)
+
+    return {
+        "working": working_employees,
+        "on_leave": on_leave_employees,
+        "pending": pending_employees,
+        "working_count": len(working_employees),
+        "on_leave_count": len(on_leave_employees),
+        "pending_count": len(pending_employees)
+    }
+
+def daily_status_counts(headcount: int, requests, start: date, end: date) -> List[Dict]:
+    """Per-day working / on_leave / pending_leave counts for every day in [start, end].
+
+    Each request adds +1 at its first day in range and -1 after its last one in a
+    difference array per status, so the whole range costs O(R + D) instead of
+    rescanning the requests for every day.
+    """
+    days = (end - start).days + 1
+    approved_delta = [0] * (days + 1)
+    pending_delta = [0] * (days + 1)
+    for request in requests:
+        if request.status == 'APPROVED':
+            delta = approved_delta
+        elif request.status == 'PENDING':
+            delta = pending_delta
+        else:
+            continue
+        first = max((request.vacation_start_date.date() - start).days, 0)
+        last = min((request.vacation_end_date.date() - start).days, days - 1)
+        if first > last:
+            continue
+        delta[first] += 1
+        delta[last + 1] -= 1
+
+    counts = []
+    on_leave_count = 0
+    pending_leave_count = 0
+    for offset in range(days):
+        on_leave_count += approved_delta[offset]
+        pending_leave_count += pending_delta[offset]
+        counts.append({
+            "date": start + timedelta(days=offset),
+            "working": headcount - on_leave_count - pending_leave_count,
+            "on_leave": on_leave_count,
+            "pending_leave": pending_leave_count
+        })
+    return counts
+
+def overlaps_request(request: RequestCreate):
+    return (
+        (RequestModel.author_id == request.author_id) &
+        (RequestModel.vacation_start_date <= request.vacation_end_date) &
+        (RequestModel.vacation_end_date >= request.vacation_start_date)
+    )
+
+def overlapping_request_query(request: RequestCreate):
+    return select(exists().where(overlaps_request(request) & RequestModel.status.in_(['PENDING', 'APPROVED'])))
+
+def create_request_validation_query(request: RequestCreate):
+    """Single SELECT answering every precondition of create_request.
+
+    Each column maps to one of the endpoint's error responses, so the caller can
+    report exactly which check failed.
+    """
+    def overlapping(status):
+        return exists().where(overlaps_request(request) & (RequestModel.status == status))
+
+    employee_table = EmployeeModel.__table__
+    relation_table = ManagerEmployeeRelationModel.__table__
+    return select(
+        exists().where(employee_table.c.id == request.author_id).label('employee_exists'),
+        select(employee_table.c.holidays_left).where(employee_table.c.id == request.author_id).scalar_subquery().label('holidays_left'),
+        exists().where(employee_table.c.id == request.manager_id).label('manager_exists'),
+        exists().where(
+            (relation_table.c.manager_id == request.manager_id) &
+            (relation_table.c.employee_id == request.author_id)
+        ).label('is_manager_of_employee'),
+        overlapping('PENDING').label('has_pending_overlap'),
+        overlapping('APPROVED').label('has_approved_overlap'),
+    )
 
 @router.post("/requests", response_model=RequestResponse)
 async def create_request(request: RequestCreate):
@@ -70,77 +200,52 @@ async def create_request(request: RequestCreate):
     if request.status!='PENDING':
         raise HTTPException(status_code=400, detail="Request status must be PENDING")
 
-    # Fetch the employee details to check holidays left
-    employee_query = EmployeeModel.__table__.select().where(EmployeeModel.id == request.author_id)
-    employee = await database.fetch_one(employee_query)
-    if not employee:
+    # Check the employee, manager, relation and overlapping requests in one round trip
+    validation = await database.fetch_one(create_request_validation_query(request))
+    if not validation.employee_exists:
         raise HTTPException(status_code=404, detail="Employee not found")
-    # print("employee",employee.name)
-    # Calculate the number of weekdays in the requested period
 
-    manager_query = EmployeeModel.__table__.select().where(EmployeeModel.id == request.manager_id)
-    manager = await database.fetch_one(manager_query)
-    if not manager:
+    if not validation.manager_exists:
         raise HTTPException(status_code=404, detail="Manager not found")
-    
 
-    #check if the manager is the manager of the employee
-    manager_employee_relation_query = ManagerEmployeeRelationModel.__table__.select().where(
-        (ManagerEmployeeRelationModel.manager_id == request.manager_id) & 
-        (ManagerEmployeeRelationModel.employee_id == request.author_id)
-    )
-    manager_employee_relation = await database.fetch_one(manager_employee_relation_query)
-    if not manager_employee_relation:
+    if not validation.is_manager_of_employee:
         raise HTTPException(status_code=400, detail="The manager is not the manager of the employee.")
 
-    # Check for overlapping pending requests
-    pending_query = RequestModel.__table__.select().where(
-        (RequestModel.author_id == request.author_id) & 
-        (RequestModel.status == 'PENDING') & 
-        (
-            (RequestModel.vacation_start_date <= request.vacation_end_date) & 
-            (RequestModel.vacation_end_date >= request.vacation_start_date)
-        )
-    )
-    overlapping_pending_requests = await database.fetch_all(pending_query)
-    if overlapping_pending_requests:
+    if validation.has_pending_overlap:
         raise HTTPException(status_code=400, detail="There is an overlapping pending leave request for this employee.")
-    
-    # Check for overlapping approved requests
-    approved_query = RequestModel.__table__.select().where(
-        (RequestModel.author_id == request.author_id) & 
-        (RequestModel.status == 'APPROVED') & 
-        (
-            (RequestModel.vacation_start_date <= request.vacation_end_date) & 
-            (RequestModel.vacation_end_date >= request.vacation_start_date)
-        )
-    )
-    overlapping_approved_requests = await database.fetch_all(approved_query)
-    if overlapping_approved_requests:
+
+    if validation.has_approved_overlap:
         raise HTTPException(status_code=400, detail="There is an overlapping approved leave request for this employee.")
-    
-    
 
-    days_requested = count_weekdays(request.vacation_start_date, request.vacation_end_date)
-    if days_requested > employee.holidays_left:
+    days_requested = count_business_days(request.vacation_start_date, request.vacation_end_date)
+    if days_requested > validation.holidays_left:
         raise HTTPException(status_code=400, detail="Number of weekdays requested exceeds the number of holidays left")
 
-    # Create the new request
-    query = RequestModel.__table__.insert().values(
-        author_id=request.author_id,
-        status=request.status,
-        manager_id=request.manager_id,
-        request_created_date=request.request_created_date or datetime.utcnow(),
-        vacation_start_date=request.vacation_start_date,
-        vacation_end_date=request.vacation_end_date
-    )
-    last_record_id = await database.execute(query)
-
-    # Update holidays_left for the employee
-    update_holidays_query = EmployeeModel.__table__.update().where(EmployeeModel.id == request.author_id).values(
-        holidays_left=EmployeeModel.holidays_left - days_requested
-    )
-    await database.execute(update_holidays_query)
+    async with database.transaction():
+        # Debit holidays_left only if the balance still covers the request. The conditional UPDATE
+        # locks the employee row, so concurrent submissions for the same employee are serialised here
+        if days_requested > 0:
+            debit_holidays_query = EmployeeModel.__table__.update().where(
+                (EmployeeModel.id == request.author_id) &
+                (EmployeeModel.holidays_left >= days_requested)
+            ).values(holidays_left=EmployeeModel.holidays_left - days_requested)
+            if not await execute_rowcount(debit_holidays_query):
+                raise HTTPException(status_code=400, detail="Number of weekdays requested exceeds the number of holidays left")
+
+            # Another submission may have been committed since the validation query, recheck under the lock
+            if await database.fetch_val(overlapping_request_query(request)):
+                raise HTTPException(status_code=400, detail="There is an overlapping pending leave request for this employee.")
+
+        # Create the new request
+        query = RequestModel.__table__.insert().values(
+            author_id=request.author_id,
+            status=request.status,
+            manager_id=request.manager_id,
+            request_created_date=request.request_created_date or datetime.utcnow(),
+            vacation_start_date=request.vacation_start_date,
+            vacation_end_date=request.vacation_end_date
+        )
+        last_record_id = await database.execute(query)
 
     return {
         "id": last_record_id,
@@ -152,6 +257,182 @@ async def create_request(request: RequestCreate):
         "vacation_end_date": request.vacation_end_date
     }
 
+async def read_ndjson_lines(stream):
+    """Yields (line number, line) from a byte stream without holding more than one chunk in memory."""
+    buffer = b""
+    line_number = 0
+    async for chunk in stream:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            line_number += 1
+            if line.strip():
+                yield line_number, line
+    if buffer.strip():
+        yield line_number + 1, buffer
+
+def validation_error_detail(error: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(str(part) for part in e['loc']) or 'line'}: {e['msg']}" for e in error.errors())
+
+async def validate_request_chunk(rows):
+    """Checks a chunk of bulk rows against the database with a fixed number of queries.
+
+    Returns (rows to insert, holidays to debit per employee, errors).
+    """
+    errors = []
+    candidates = []
+    for line, request in rows:
+        if request.vacation_start_date > request.vacation_end_date:
+            errors.append({"line": line, "detail": "Vacation start date cannot be later than vacation end date."})
+        else:
+            candidates.append((line, request))
+    if not candidates:
+        return [], {}, errors
+
+    employee_table = EmployeeModel.__table__
+    relation_table = ManagerEmployeeRelationModel.__table__
+    author_ids = {request.author_id for _, request in candidates}
+    person_ids = author_ids | {request.manager_id for _, request in candidates}
+
+    # Employees and managers, direct managers of the authors, and the authors' booked leave in the chunk's window
+    employee_rows = await database.fetch_all(
+        select(employee_table.c.id, employee_table.c.holidays_left).where(employee_table.c.id.in_(person_ids))
+    )
+    balances = {row.id: row.holidays_left or 0 for row in employee_rows}
+    relation_rows = await database.fetch_all(
+        select(relation_table.c.employee_id, relation_table.c.manager_id).where(relation_table.c.employee_id.in_(author_ids))
+    )
+    manager_of = {row.employee_id: row.manager_id for row in relation_rows}
+    booked_rows = await database.fetch_all(
+        select(RequestModel.author_id, RequestModel.status, RequestModel.vacation_start_date, RequestModel.vacation_end_date).where(
+            (RequestModel.author_id.in_(author_ids)) &
+            (RequestModel.status.in_(['PENDING', 'APPROVED'])) &
+            (RequestModel.vacation_start_date <= max(request.vacation_end_date for _, request in candidates)) &
+            (RequestModel.vacation_end_date >= min(request.vacation_start_date for _, request in candidates))
+        )
+    )
+    booked = defaultdict(list)
+    for row in booked_rows:
+        booked[row.author_id].append((row.status, row.vacation_start_date, row.vacation_end_date))
+
+    days = count_business_days_batch((request.vacation_start_date, request.vacation_end_date) for _, request in candidates)
+
+    inserts = []
+    debits = defaultdict(int)
+    created = datetime.utcnow()
+    for (line, request), days_requested in zip(candidates, days):
+        author_id = request.author_id
+        if author_id not in balances:
+            errors.append({"line": line, "detail": "Employee not found"})
+            continue
+        if request.manager_id not in balances:
+            errors.append({"line": line, "detail": "Manager not found"})
+            continue
+        if manager_of.get(author_id) != request.manager_id:
+            errors.append({"line": line, "detail": "The manager is not the manager of the employee."})
+            continue
+
+        if request.status != 'DENIED':
+            overlapping = {
+                status for status, start, end in booked[author_id]
+                if start <= request.vacation_end_date and end >= request.vacation_start_date
+            }
+            if 'PENDING' in overlapping:
+                errors.append({"line": line, "detail": "There is an overlapping pending leave request for this employee."})
+                continue
+            if 'APPROVED' in overlapping:
+                errors.append({"line": line, "detail": "There is an overlapping approved leave request for this employee."})
+                continue
+            if days_requested > balances[author_id]:
+                errors.append({"line": line, "detail": "Number of weekdays requested exceeds the number of holidays left"})
+                continue
+            balances[author_id] -= days_requested
+            booked[author_id].append((request.status, request.vacation_start_date, request.vacation_end_date))
+            if days_requested:
+                debits[author_id] += days_requested
+
+        inserts.append({
+            "author_id": author_id,
+            "status": request.status,
+            "manager_id": request.manager_id,
+            "request_created_date": request.request_created_date or created,
+            "vacation_start_date": request.vacation_start_date,
+            "vacation_end_date": request.vacation_end_date
+        })
+    return inserts, debits, errors
+
+async def import_request_chunk(rows):
+    """Validates and writes one chunk, returns (inserted count, errors)."""
+    employee_table = EmployeeModel.__table__
+    for _ in range(BULK_CHUNK_ATTEMPTS):
+        inserts, debits, errors = await validate_request_chunk(rows)
+        try:
+            async with database.transaction():
+                if debits:
+                    # One grouped, conditional debit for every employee in the chunk
+                    debit = case(debits, value=employee_table.c.id)
+                    debit_query = employee_table.update().where(
+                        (employee_table.c.id.in_(list(debits))) &
+                        (employee_table.c.holidays_left >= debit)
+                    ).values(holidays_left=employee_table.c.holidays_left - debit)
+                    if await execute_rowcount(debit_query) != len(debits):
+                        raise BalanceChanged()
+                await insert_many(RequestModel.__table__, inserts)
+            return len(inserts), errors
+        except BalanceChanged:
+            continue
+
+    return 0, [{"line": line, "detail": "Holidays left changed during the import, retry this row"} for line, _ in rows]
+
+@router.post("/requests/bulk", response_model=BulkImportResult)
+async def bulk_import_requests(http_request: HTTPRequest):
+    """Imports leave requests from an NDJSON body, one RequestCreate object per line.
+
+    Rows are validated and written in chunks of BULK_CHUNK_SIZE. Unlike POST /requests
+    any status is accepted, PENDING and APPROVED rows debit holidays_left. Invalid rows
+    are reported by line number and do not stop the import.
+    """
+    received = 0
+    inserted = 0
+    failed = 0
+    errors = []
+
+    def report(chunk_errors):
+        nonlocal failed
+        failed += len(chunk_errors)
+        errors.extend(chunk_errors[:MAX_REPORTED_ERRORS - len(errors)])
+
+    chunk = []
+    async for line_number, line in read_ndjson_lines(http_request.stream()):
+        received += 1
+        try:
+            request = RequestCreate.model_validate_json(line)
+        except ValidationError as e:
+            report([{"line": line_number, "detail": validation_error_detail(e)}])
+            continue
+        request.vacation_start_date = request.vacation_start_date.replace(tzinfo=None)
+        request.vacation_end_date = request.vacation_end_date.replace(tzinfo=None)
+        chunk.append((line_number, request))
+
+        if len(chunk) >= BULK_CHUNK_SIZE:
+            chunk_inserted, chunk_errors = await import_request_chunk(chunk)
+            inserted += chunk_inserted
+            report(chunk_errors)
+            chunk = []
+
+    if chunk:
+        chunk_inserted, chunk_errors = await import_request_chunk(chunk)
+        inserted += chunk_inserted
+        report(chunk_errors)
+
+    return {
+        "received": received,
+        "inserted": inserted,
+        "failed": failed,
+        "errors": errors,
+        "errors_truncated": failed > len(errors)
+    }
+
 @router.get("/requests", response_model=List[RequestResponse])
 async def get_requests():
     query = RequestModel.__table__.select()
@@ -191,21 +472,22 @@ async def update_request(request_id: int, request: RequestUpdate):
         raise HTTPException(status_code=400, detail="Approved requests cannot be updated")
 
     update_data = request.dict(exclude_unset=True)
-    query = RequestModel.__table__.update().where(RequestModel.id == request_id).values(**update_data)
-    await database.execute(query)
-
-    # Initialize update_holidays_query variable
-    update_holidays_query = None
-
-    # Update holidays_left for the employee
-    if 'status' in update_data and update_data['status'] == 'DENIED':
-        days_requested = count_weekdays(current_request['vacation_start_date'], current_request['vacation_end_date'])
-        update_holidays_query = EmployeeModel.__table__.update().where(EmployeeModel.id == current_request['author_id']).values(
-            holidays_left=EmployeeModel.holidays_left + days_requested
-        )
+    async with database.transaction():
+        query = RequestModel.__table__.update().where(RequestModel.id == request_id).values(**update_data)
+        await database.execute(query)
+
+        # Initialize update_holidays_query variable
+        update_holidays_query = None
+
+        # Update holidays_left for the employee
+        if 'status' in update_data and update_data['status'] == 'DENIED':
+            days_requested = count_business_days(current_request['vacation_start_date'], current_request['vacation_end_date'])
+            update_holidays_query = EmployeeModel.__table__.update().where(EmployeeModel.id == current_request['author_id']).values(
+                holidays_left=EmployeeModel.holidays_left + days_requested
+            )
 
-    if update_holidays_query is not None:
-        await database.execute(update_holidays_query)
+        if update_holidays_query is not None:
+            await database.execute(update_holidays_query)
 
     updated_request = await database.fetch_one(RequestModel.__table__.select().where(RequestModel.id == request_id))
     return updated_request
@@ -220,23 +502,52 @@ async def delete_request(request_id: int):
     if request is None:
         raise HTTPException(status_code=404, detail="Request not found")
 
-    # Update the number of leaves if the request is pending
-    if request.status == 'PENDING' or request.status == 'APPROVED':
-        # Fetch the employee details
-        employee_query = EmployeeModel.__table__.select().where(EmployeeModel.id == request.author_id)
-        employee = await database.fetch_one(employee_query)
-        if employee:
-            updated_holidays_left = employee.holidays_left + count_weekdays(request.vacation_start_date, request.vacation_end_date)
+    async with database.transaction():
+        # Give the leaves back if the request is pending or approved. The refund is relative so it
+        # cannot overwrite a debit made by a concurrent create_request
+        if request.status == 'PENDING' or request.status == 'APPROVED':
             update_employee_query = EmployeeModel.__table__.update().where(EmployeeModel.id == request.author_id).values(
-                holidays_left=updated_holidays_left
+                holidays_left=EmployeeModel.holidays_left + count_business_days(request.vacation_start_date, request.vacation_end_date)
             )
             await database.execute(update_employee_query)
 
-    # Delete the request
-    query = RequestModel.__table__.delete().where(RequestModel.id == request_id)
-    await database.execute(query)
+        # Delete the request
+        query = RequestModel.__table__.delete().where(RequestModel.id == request_id)
+        await database.execute(query)
     return {"message": "Request deleted successfully"}
 
+@router.get("/manager/{manager_id}/employee-status-range", response_model=List[DailyStatusCounts])
+async def get_employee_status_range(manager_id: int, start: date, end: date):
+    if start > end:
+        raise HTTPException(status_code=400, detail="Range start cannot be later than range end.")
+    if (end - start).days >= MAX_STATUS_RANGE_DAYS:
+        raise HTTPException(status_code=400, detail=f"Range cannot be longer than {MAX_STATUS_RANGE_DAYS} days.")
+
+    # Count employees under the given manager
+    relation_table = ManagerEmployeeRelationModel.__table__
+    headcount_query = select(func.count()).select_from(relation_table).where(relation_table.c.manager_id == manager_id)
+    headcount = await database.fetch_val(headcount_query)
+
+    if not headcount:
+        return daily_status_counts(0, [], start, end)
+
+    # Get the team's requests overlapping the range once
+    request_query = select(
+        RequestModel.status, RequestModel.vacation_start_date, RequestModel.vacation_end_date
+    ).select_from(
+        RequestModel.__table__.join(relation_table, relation_table.c.employee_id == RequestModel.author_id)
+    ).where(
+        (relation_table.c.manager_id == manager_id) &
+        (RequestModel.status.in_(['PENDING', 'APPROVED'])) &
+        (
+            (RequestModel.vacation_start_date < datetime.combine(end + timedelta(days=1), time.min)) &
+            (RequestModel.vacation_end_date >= datetime.combine(start, time.min))
+        )
+    )
+    requests = await database.fetch_all(request_query)
+
+    return daily_status_counts(headcount, requests, start, end)
+
 @router.get("/manager/{manager_id}/employee-status/{date}", response_model=dict)
 async def get_employee_status(manager_id: int, date: datetime):
     # Get employees under the given manager
@@ -272,6 +583,7 @@ async def get_employee_status(manager_id: int, date: datetime):
 async def get_employee_status_details(manager_id: int, date: datetime):
     # Ensure date is offset-naive
     date = date.replace(tzinfo=None).date()
+    day_start = datetime.combine(date, time.min)
     
     # check if the manager exists
     manager_query = EmployeeModel.__table__.select().where(EmployeeModel.id == manager_id)
@@ -279,56 +591,26 @@ async def get_employee_status_details(manager_id: int, date: datetime):
     if not manager:
         raise HTTPException(status_code=404, detail="Manager not found")
 
-    # Get employees under the given manager
-    relation_query = ManagerEmployeeRelationModel.__table__.select().where(ManagerEmployeeRelationModel.manager_id == manager_id)
-    employee_relations = await database.fetch_all(relation_query)
-    employee_ids = [relation.employee_id for relation in employee_relations]
+    # Get employees under the given manager in one join
+    relation_table = ManagerEmployeeRelationModel.__table__
+    employee_query = select(EmployeeModel.__table__).select_from(
+        relation_table.join(EmployeeModel.__table__, relation_table.c.employee_id == EmployeeModel.id)
+    ).where(relation_table.c.manager_id == manager_id).order_by(relation_table.c.id)
+    employees = await database.fetch_all(employee_query)
 
-    if not employee_ids:
+    if not employees:
         return {"working": [], "on_leave": [], "pending": [],"working_count": 0,"on_leave_count": 0,"pending_count": 0}
 
-    # Get requests for the given date
-    request_query = RequestModel.__table__.select().where(
-        (RequestModel.author_id.in_(employee_ids)) & 
+    # Get the team's requests overlapping the given date
+    request_query = RequestModel.__table__.select().select_from(
+        RequestModel.__table__.join(relation_table, relation_table.c.employee_id == RequestModel.author_id)
+    ).where(
+        (relation_table.c.manager_id == manager_id) &
         (
-            (RequestModel.vacation_start_date <= date) & 
-            (RequestModel.vacation_end_date >= date)
+            (RequestModel.vacation_start_date < day_start + timedelta(days=1)) &
+            (RequestModel.vacation_end_date >= day_start)
         )
-    )
+    ).order_by(RequestModel.id)
     requests = await database.fetch_all(request_query)
 
-    working_employees = []
-    on_leave_employees = []
-    pending_employees = []
-
-    for employee_id in employee_ids:
-        employee_query = EmployeeModel.__table__.select().where(EmployeeModel.id == employee_id)
-        employee = await database.fetch_one(employee_query)
-
-        if employee:
-            employee_dict = dict(employee)
-            employee_dict['requests'] = []
-
-            for request in requests:
-                if request.author_id == employee_id:
-                    # Ensure request dates are offset-naive
-                    request_dict = dict(request)
-                    request_dict['vacation_start_date'] = request_dict['vacation_start_date'].replace(tzinfo=None).date()
-                    request_dict['vacation_end_date'] = request_dict['vacation_end_date'].replace(tzinfo=None).date()
-                    employee_dict['requests'].append(request_dict)
-
-            if any(request['status'] == 'APPROVED' and request['vacation_start_date'] <= date <= request['vacation_end_date'] for request in employee_dict['requests']):
-                on_leave_employees.append(employee_dict)
-            elif any(request['status'] == 'PENDING' and request['vacation_start_date'] <= date <= request['vacation_end_date'] for request in employee_dict['requests']):
-                pending_employees.append(employee_dict)
-            else:
-                working_employees.append(employee_dict)
-
-    return {
-        "working": working_employees,
-        "on_leave": on_leave_employees,
-        "pending": pending_employees,
-        "working_count": len(working_employees),
-        "on_leave_count": len(on_leave_employees),
-        "pending_count": len(pending_employees)
-    }
+    return classify_employee_statuses(employees, requests, date)
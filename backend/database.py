@@ -1,5 +1,6 @@
+import os
 import time
-from sqlalchemy import create_engine, MetaData, inspect
+from sqlalchemy import create_engine, func, select, MetaData, inspect
 from sqlalchemy.orm import sessionmaker, declarative_base
 from databases import Database
 from config import DATABASE_URL, TEST_DATABASE_URL, TESTING
@@ -21,6 +22,26 @@ def get_db():
     finally:
         db.close()
 
+async def execute_rowcount(query) -> int:
+    """Executes an UPDATE/DELETE and returns the number of rows it changed.
+
+    `database.execute` returns the cursor's lastrowid, which is stale for an UPDATE
+    running on a connection that has already inserted, so ask the server instead.
+    Runs on the caller's connection, so it can be used inside `database.transaction()`.
+    """
+    row_count = func.changes() if database.url.dialect == "sqlite" else func.row_count()
+    async with database.connection() as connection:
+        await connection.execute(query)
+        return await connection.fetch_val(select(row_count))
+
+async def insert_many(table, rows, batch_size=500):
+    """Inserts `rows` (a list of dicts) using multi-row INSERT statements of `batch_size` rows.
+
+    `database.execute_many` sends one statement per row on every backend.
+    """
+    for offset in range(0, len(rows), batch_size):
+        await database.execute(table.insert().values(rows[offset:offset + batch_size]))
+
 def table_exists(engine, table_name):
     inspector = inspect(engine)
     return inspector.has_table(table_name)
@@ -54,6 +75,21 @@ def create_db_and_tables():
         from models.RequestConstraints import RequestConstraint
         Base.metadata.create_all(engine, tables=[RequestConstraint.__table__])
 
+    upgrade_schema()
+
+def upgrade_schema():
+    # Apply pending migrations (e.g. new indexes) to databases created by earlier versions
+    from alembic import command
+    from alembic.config import Config
+
+    backend_dir = os.path.dirname(os.path.abspath(__file__))
+    alembic_config = Config(os.path.join(backend_dir, "alembic.ini"))
+    alembic_config.set_main_option("script_location", os.path.join(backend_dir, "migrations"))
+    alembic_config.attributes["configure_logger"] = False
+    with engine.begin() as connection:
+        alembic_config.attributes["connection"] = connection
+        command.upgrade(alembic_config, "head")
+
 
 def insert_initial_employee_data():
     from models.Employee import Employee
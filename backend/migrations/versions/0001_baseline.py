@@ -0,0 +1,75 @@
+"""Baseline schema as created by database.create_db_and_tables
+
+Tables that already exist are left alone, so databases created before
+migrations were introduced can be upgraded in place.
+
+Revision ID: 0001_baseline
+Revises:
+Create Date: 2024-11-01 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0001_baseline'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    existing_tables = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if 'employee' not in existing_tables:
+        op.create_table(
+            'employee',
+            sa.Column('id', sa.Integer(), primary_key=True),
+            sa.Column('name', sa.String(50)),
+            sa.Column('age', sa.Integer()),
+            sa.Column('contact_details', sa.String(100)),
+            sa.Column('holidays_left', sa.Integer(), sa.CheckConstraint('holidays_left >= 0 AND holidays_left <= 30')),
+            sa.UniqueConstraint('name', name='uq_employee_name'),
+        )
+        op.create_index('ix_employee_id', 'employee', ['id'])
+        op.create_index('ix_employee_name', 'employee', ['name'], unique=True)
+
+    if 'manager' not in existing_tables:
+        op.create_table(
+            'manager',
+            sa.Column('id', sa.Integer(), primary_key=True),
+            sa.Column('employee_id', sa.Integer(), sa.ForeignKey('employee.id'), unique=True),
+            sa.UniqueConstraint('employee_id', name='uq_manager_employee_id'),
+        )
+        op.create_index('ix_manager_id', 'manager', ['id'])
+
+    if 'manager_employee_relation' not in existing_tables:
+        op.create_table(
+            'manager_employee_relation',
+            sa.Column('id', sa.Integer(), primary_key=True),
+            sa.Column('manager_id', sa.Integer(), sa.ForeignKey('manager.employee_id'), nullable=True),
+            sa.Column('employee_id', sa.Integer(), sa.ForeignKey('employee.id'), nullable=False, unique=True),
+            sa.CheckConstraint('manager_id != employee_id', name='check_manager_employee_different'),
+        )
+        op.create_index('ix_manager_employee_relation_id', 'manager_employee_relation', ['id'])
+
+    if 'request' not in existing_tables:
+        op.create_table(
+            'request',
+            sa.Column('id', sa.Integer(), primary_key=True),
+            sa.Column('author_id', sa.Integer(), sa.ForeignKey('employee.id')),
+            sa.Column('status', sa.String(50)),
+            sa.Column('manager_id', sa.Integer(), sa.ForeignKey('employee.id')),
+            sa.Column('request_created_date', sa.DateTime()),
+            sa.Column('vacation_start_date', sa.DateTime()),
+            sa.Column('vacation_end_date', sa.DateTime()),
+            sa.CheckConstraint('author_id != manager_id', name='check_author_manager_different'),
+            sa.CheckConstraint('vacation_end_date >= vacation_start_date', name='check_end_date_after_start_date'),
+        )
+        op.create_index('ix_request_id', 'request', ['id'])
+
+
+def downgrade():
+    op.drop_table('request')
+    op.drop_table('manager_employee_relation')
+    op.drop_table('manager')
+    op.drop_table('employee')
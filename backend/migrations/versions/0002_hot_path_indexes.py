@@ -0,0 +1,43 @@
+"""Composite indexes for the request and relation hot paths
+
+- request(author_id, status, vacation_start_date, vacation_end_date): overlap checks
+  in create_request and the team status endpoints
+- request(manager_id, status, request_created_date): manager request queues
+- manager_employee_relation(manager_id): roster lookups
+
+Indexes already created from the models by create_all are skipped.
+
+Revision ID: 0002_hot_path_indexes
+Revises: 0001_baseline
+Create Date: 2024-11-02 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0002_hot_path_indexes'
+down_revision = '0001_baseline'
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ('ix_request_author_status_dates', 'request', ['author_id', 'status', 'vacation_start_date', 'vacation_end_date']),
+    ('ix_request_manager_status_created', 'request', ['manager_id', 'status', 'request_created_date']),
+    ('ix_manager_employee_relation_manager_id', 'manager_employee_relation', ['manager_id']),
+]
+
+
+def _existing_indexes(table_name):
+    return {index['name'] for index in sa.inspect(op.get_bind()).get_indexes(table_name)}
+
+
+def upgrade():
+    for name, table_name, columns in INDEXES:
+        if name not in _existing_indexes(table_name):
+            op.create_index(name, table_name, columns)
+
+
+def downgrade():
+    for name, table_name, _ in reversed(INDEXES):
+        if name in _existing_indexes(table_name):
+            op.drop_index(name, table_name=table_name)
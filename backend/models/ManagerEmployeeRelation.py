@@ -5,7 +5,7 @@ class ManagerEmployeeRelation(Base):
     __tablename__ = 'manager_employee_relation'
 
     id = Column(Integer, primary_key=True, index=True)
-    manager_id = Column(Integer, ForeignKey('manager.employee_id'), nullable=True)
+    manager_id = Column(Integer, ForeignKey('manager.employee_id'), nullable=True, index=True)
     employee_id = Column(Integer, ForeignKey('employee.id'), nullable=False, unique=True)
 
     __table_args__ = (
@@ -1,5 +1,5 @@
 import datetime
-from sqlalchemy import Column, DateTime, Integer, ForeignKey, String, CheckConstraint
+from sqlalchemy import Column, DateTime, Integer, ForeignKey, String, CheckConstraint, Index
 from database import Base
 
 class Request(Base):
@@ -17,4 +17,8 @@ class Request(Base):
     __table_args__ = (
         CheckConstraint('author_id != manager_id', name='check_author_manager_different'),
         CheckConstraint('vacation_end_date >= vacation_start_date', name='check_end_date_after_start_date'),
+        # Overlap checks and team status lookups filter on the author, status and vacation window
+        Index('ix_request_author_status_dates', 'author_id', 'status', 'vacation_start_date', 'vacation_end_date'),
+        # Manager queues filter on the approver and status, newest first
+        Index('ix_request_manager_status_created', 'manager_id', 'status', 'request_created_date'),
     )
@@ -0,0 +1,51 @@
+import sys
+import os
+from datetime import date, datetime, timedelta
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from business_days import BusinessCalendar, count_business_days, count_business_days_batch, weekdays_in_span
+
+def count_weekdays_by_walking(start_date, end_date):
+    # The original day-by-day implementation, kept as the reference
+    count = 0
+    current_date = start_date
+    while current_date <= end_date:
+        if current_date.weekday() < 5:
+            count += 1
+        current_date += timedelta(days=1)
+    return count
+
+def test_matches_day_by_day_count():
+    base = datetime(2024, 10, 28)
+    for start_offset in range(14):
+        for length in range(-2, 40):
+            start = base + timedelta(days=start_offset)
+            end = start + timedelta(days=length)
+            assert count_business_days(start, end) == count_weekdays_by_walking(start, end)
+
+def test_matches_day_by_day_count_with_times():
+    start = datetime(2024, 11, 10, 10, 0)
+    end = datetime(2024, 11, 14, 0, 0)
+    assert count_business_days(start, end) == count_weekdays_by_walking(start, end) == 3
+
+def test_matches_outside_precomputed_table():
+    for start, end in [(date(1999, 12, 25), date(2000, 1, 20)), (date(2019, 12, 20), date(2020, 1, 10)), (date(2040, 2, 1), date(2041, 3, 3))]:
+        assert count_business_days(start, end) == count_weekdays_by_walking(start, end)
+
+def test_weekdays_in_span_closed_form():
+    for first_day in (date(2024, 11, 4) + timedelta(days=i) for i in range(7)):
+        for days in range(30):
+            assert weekdays_in_span(first_day, days) == count_weekdays_by_walking(first_day, first_day + timedelta(days=days - 1))
+
+def test_public_holidays_are_not_counted():
+    calendar = BusinessCalendar(holidays=[date(2024, 11, 11), date(2024, 11, 28), date(2024, 11, 30)], table_start=date(2024, 1, 1), table_end=date(2024, 12, 31))
+    assert calendar.count(date(2024, 11, 1), date(2024, 11, 30)) == 19
+    # Same answer from the closed-form path outside the table
+    calendar = BusinessCalendar(holidays=[date(2024, 11, 11), date(2024, 11, 28), date(2024, 11, 30)], table_start=date(2025, 1, 1), table_end=date(2025, 12, 31))
+    assert calendar.count(date(2024, 11, 1), date(2024, 11, 30)) == 19
+
+def test_batch_matches_single_counts():
+    ranges = [(datetime(2024, 11, d), datetime(2024, 11, d) + timedelta(days=n)) for d in range(1, 29) for n in range(-1, 10)]
+    ranges.append((date(2050, 1, 1), date(2050, 2, 1)))
+    assert count_business_days_batch(ranges) == [count_weekdays_by_walking(start, end) for start, end in ranges]
@@ -515,4 +515,141 @@ def test_invalid_manager_access_to_date_reequests():
 def test_valid_manager_access_to_date_reequests():
     response = client.get("/manager/1/employee-status-details/2024-11-10T00:00:00")
     assert response.status_code == 200
-    assert isinstance(response.json(), dict)
\ No newline at end of file
+    assert isinstance(response.json(), dict)
+
+'''QUERY BUDGETS'''
+
+def count_queries(monkeypatch, method, url, **kwargs):
+    # Counts the statements sent through any `databases` connection while serving one call
+    from databases.core import Connection
+    issued = []
+    for name in ("fetch_one", "fetch_all", "fetch_val", "execute", "execute_many"):
+        original = getattr(Connection, name)
+
+        async def counted(self, query, *args, _original=original, **kw):
+            issued.append(query)
+            return await _original(self, query, *args, **kw)
+
+        monkeypatch.setattr(Connection, name, counted)
+    response = client.request(method, url, **kwargs)
+    monkeypatch.undo()
+    assert response.status_code == 200
+    return len(issued), response.json()
+
+def test_get_employees_by_manager_query_count_constant(monkeypatch):
+    small_count, small_team = count_queries(monkeypatch, "GET", "/manager/1/employees")
+
+    for i in range(5):
+        response = client.post(
+            "/employees",
+            json={"name": f"Team Member {i}", "age": 25, "contact_details": f"member{i}@example.com", "holidays_left": 20, "manager_id": 1},
+        )
+        assert response.status_code == 200
+        response = client.post("/requests", json={
+            "author_id": response.json()["id"],
+            "status": "PENDING",
+            "manager_id": 1,
+            "vacation_start_date": "2024-11-04T00:00:00",
+            "vacation_end_date": "2024-11-05T00:00:00"
+        })
+        assert response.status_code == 200
+
+    large_count, large_team = count_queries(monkeypatch, "GET", "/manager/1/employees")
+    assert large_count == small_count
+    assert len(large_team) == len(small_team) + 5
+    assert all(len(employee["requests"]) == 1 for employee in large_team[-5:])
+
+def test_employee_status_details_classifies_team(monkeypatch):
+    small_count, _ = count_queries(monkeypatch, "GET", "/manager/1/employee-status-details/2024-11-20T00:00:00")
+    query_count, details = count_queries(monkeypatch, "GET", "/manager/1/employee-status-details/2024-11-04T00:00:00")
+    assert query_count == small_count
+    assert details["pending_count"] == 5
+    assert details["on_leave_count"] == 0
+    assert details["working_count"] == len(details["working"])
+    assert all(employee["requests"][0]["vacation_start_date"] == "2024-11-04" for employee in details["pending"])
+
+def test_employee_status_range():
+    response = client.get("/manager/1/employee-status-range?start=2024-11-03&end=2024-11-06")
+    assert response.status_code == 200
+    days = response.json()
+    assert [day["date"] for day in days] == ["2024-11-03", "2024-11-04", "2024-11-05", "2024-11-06"]
+    assert [day["pending_leave"] for day in days] == [0, 5, 5, 0]
+    for day in days:
+        single_day = client.get(f"/manager/1/employee-status/{day['date']}T00:00:00").json()
+        assert day["working"] + day["on_leave"] + day["pending_leave"] == sum(single_day.values())
+        assert day["on_leave"] == single_day["on_leave"]
+
+def test_employee_status_range_invalid():
+    response = client.get("/manager/1/employee-status-range?start=2024-11-06&end=2024-11-03")
+    assert response.status_code == 400
+    response = client.get("/manager/1/employee-status-range?start=2024-01-01&end=2025-12-31")
+    assert response.status_code == 400
+
+def test_create_request_validates_in_one_query(monkeypatch):
+    employee_id = next(employee["id"] for employee in client.get("/employees").json() if employee["name"] == "Team Member 0")
+    query_count, created = count_queries(monkeypatch, "POST", "/requests", json={
+        "author_id": employee_id,
+        "status": "PENDING",
+        "manager_id": 1,
+        "vacation_start_date": "2024-11-18T00:00:00",
+        "vacation_end_date": "2024-11-19T00:00:00"
+    })
+    # validation, then in one transaction: debit, its row count, overlap recheck and insert
+    assert query_count == 5
+    assert created["author_id"] == employee_id
+
+    client.put(f"/requests/{created['id']}", json={"status": "APPROVED"})
+    response = client.post("/requests", json={
+        "author_id": employee_id,
+        "status": "PENDING",
+        "manager_id": 1,
+        "vacation_start_date": "2024-11-19T00:00:00",
+        "vacation_end_date": "2024-11-20T00:00:00"
+    })
+    assert response.status_code == 400
+    assert response.json()["detail"] == "There is an overlapping approved leave request for this employee."
+
+def test_concurrent_request_creation_does_not_overbook():
+    import asyncio
+    import httpx
+    from datetime import date
+
+    employee_ids = []
+    for i in range(4):
+        response = client.post(
+            "/employees",
+            json={"name": f"Stress Member {i}", "age": 25, "contact_details": f"stress{i}@example.com", "holidays_left": 5, "manager_id": 1},
+        )
+        employee_ids.append(response.json()["id"])
+    weekdays = [date(2024, 11, day) for day in range(1, 31) if date(2024, 11, day).weekday() < 5]
+
+    async def submit(http, author_id, day):
+        response = await http.post("/requests", json={
+            "author_id": author_id,
+            "status": "PENDING",
+            "manager_id": 1,
+            "vacation_start_date": f"{day.isoformat()}T00:00:00",
+            "vacation_end_date": f"{day.isoformat()}T00:00:00"
+        })
+        return author_id, day, response
+
+    async def submit_all():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as http:
+            # every weekday three times per employee: 252 submissions for 20 days of balance
+            return await asyncio.gather(*(
+                submit(http, author_id, day) for _ in range(3) for day in weekdays for author_id in employee_ids
+            ))
+
+    started = time.perf_counter()
+    results = asyncio.run(submit_all())
+    elapsed = time.perf_counter() - started
+    print(f"{len(results)} concurrent submissions in {elapsed:.2f}s ({len(results) / elapsed:.0f}/s)")
+
+    for author_id, day, response in results:
+        assert response.status_code in (200, 400), response.text
+    for employee_id in employee_ids:
+        booked_days = [day for author_id, day, response in results if author_id == employee_id and response.status_code == 200]
+        assert len(booked_days) == 5
+        assert len(set(booked_days)) == len(booked_days)
+        assert client.get(f"/employees/{employee_id}").json()["holidays_left"] == 0
+        assert len(client.get(f"/requests/employee/{employee_id}").json()) == 5
@@ -0,0 +1,47 @@
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, inspect
+from tools.explain import check
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+def upgrade(url):
+    alembic_config = Config(os.path.join(BACKEND_DIR, "alembic.ini"))
+    alembic_config.set_main_option("script_location", os.path.join(BACKEND_DIR, "migrations"))
+    alembic_config.set_main_option("sqlalchemy.url", url)
+    alembic_config.attributes["configure_logger"] = False
+    command.upgrade(alembic_config, "head")
+
+def test_migrations_create_indexed_schema(tmp_path):
+    url = f"sqlite:///{tmp_path / 'migrated.db'}"
+    upgrade(url)
+    engine = create_engine(url)
+    indexes = {index["name"] for index in inspect(engine).get_indexes("request")}
+    engine.dispose()
+    assert {"ix_request_author_status_dates", "ix_request_manager_status_created"} <= indexes
+
+def test_migrations_adopt_existing_schema(tmp_path):
+    # A database created before migrations existed: baseline tables, no new indexes, no version table
+    url = f"sqlite:///{tmp_path / 'existing.db'}"
+    upgrade(url)
+    engine = create_engine(url)
+    with engine.begin() as connection:
+        connection.exec_driver_sql("DROP INDEX ix_request_author_status_dates")
+        connection.exec_driver_sql("DROP INDEX ix_manager_employee_relation_manager_id")
+        connection.exec_driver_sql("DROP TABLE alembic_version")
+
+    upgrade(url)
+    upgrade(url)
+    assert "ix_request_author_status_dates" in {index["name"] for index in inspect(engine).get_indexes("request")}
+    engine.dispose()
+
+def test_hot_queries_use_indexes(tmp_path):
+    url = f"sqlite:///{tmp_path / 'explained.db'}"
+    upgrade(url)
+    for name, lines, used, missing in check(url):
+        assert not missing, f"{name} does not use {missing}: {lines}"
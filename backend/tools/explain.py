@@ -0,0 +1,100 @@
+"""Checks that the hot queries are served by the indexes added in migration 0002.
+
+    python -m tools.explain                 # database from config.py
+    python -m tools.explain mysql+pymysql://root:@localhost:3306/holidaydb
+
+Prints the plan of every hot query and exits non-zero if one of them does not use its index.
+On MySQL run it against a seeded database, the optimizer skips indexes on near-empty tables.
+"""
+import os
+import re
+import sys
+from datetime import datetime
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import create_engine, select, text
+from database import DATABASE_URL
+from models.Request import Request as RequestModel
+from models.ManagerEmployeeRelation import ManagerEmployeeRelation as ManagerEmployeeRelationModel
+
+def hot_queries():
+    relation_table = ManagerEmployeeRelationModel.__table__
+    start, end = datetime(2024, 11, 4), datetime(2024, 11, 8)
+    return [
+        (
+            "create_request overlap check",
+            RequestModel.__table__.select().where(
+                (RequestModel.author_id == 2) &
+                (RequestModel.status == 'PENDING') &
+                (RequestModel.vacation_start_date <= end) &
+                (RequestModel.vacation_end_date >= start)
+            ),
+            {"ix_request_author_status_dates"},
+        ),
+        (
+            "team requests for a date range",
+            RequestModel.__table__.select().where(
+                (RequestModel.author_id.in_([2, 3, 4])) &
+                (RequestModel.vacation_start_date <= end) &
+                (RequestModel.vacation_end_date >= start)
+            ),
+            {"ix_request_author_status_dates"},
+        ),
+        (
+            "manager request queue",
+            RequestModel.__table__.select().where(
+                (RequestModel.manager_id == 1) & (RequestModel.status == 'PENDING')
+            ).order_by(RequestModel.request_created_date.desc()),
+            {"ix_request_manager_status_created"},
+        ),
+        (
+            "manager roster",
+            relation_table.select().where(relation_table.c.manager_id == 1),
+            {"ix_manager_employee_relation_manager_id"},
+        ),
+        (
+            "team requests joined through the roster",
+            select(RequestModel.__table__).select_from(
+                RequestModel.__table__.join(relation_table, relation_table.c.employee_id == RequestModel.author_id)
+            ).where(relation_table.c.manager_id == 1),
+            {"ix_manager_employee_relation_manager_id", "ix_request_author_status_dates"},
+        ),
+    ]
+
+def explain(connection, query):
+    """Returns (plan lines, names of the indexes the plan uses)."""
+    sql = str(query.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True}))
+    if connection.dialect.name == "sqlite":
+        rows = connection.execute(text("EXPLAIN QUERY PLAN " + sql)).mappings().all()
+        lines = [row["detail"] for row in rows]
+        indexes = {match for line in lines for match in re.findall(r"USING (?:COVERING )?INDEX (\w+)", line)}
+    else:
+        rows = connection.execute(text("EXPLAIN " + sql)).mappings().all()
+        lines = [" ".join(f"{key}={value}" for key, value in row.items()) for row in rows]
+        indexes = {row["key"] for row in rows if row["key"]}
+    return lines, indexes
+
+def check(url=DATABASE_URL):
+    """Returns a list of (name, plan lines, used indexes, missing indexes)."""
+    engine = create_engine(url)
+    results = []
+    with engine.connect() as connection:
+        for name, query, expected in hot_queries():
+            lines, used = explain(connection, query)
+            results.append((name, lines, used, expected - used))
+    engine.dispose()
+    return results
+
+def main():
+    url = sys.argv[1] if len(sys.argv) > 1 else DATABASE_URL
+    failed = False
+    for name, lines, used, missing in check(url):
+        print(f"{name}: {'ok' if not missing else 'MISSING ' + ', '.join(sorted(missing))}")
+        for line in lines:
+            print(f"    {line}")
+        failed = failed or bool(missing)
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()